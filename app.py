@@ -2,6 +2,12 @@ import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 # ===== 1. IMPORT LIBRARIES =====
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
 import pandas as pd
 import plotly.express as px
 from dash import Dash, dcc, html, Input, Output, dash_table
@@ -9,19 +15,13 @@ import dash_bootstrap_components as dbc
 from dash.dash_table.Format import Format, Scheme
 
 # ===== 2. LOAD AND CLEAN DATA =====
-# Load raw data from Excel
+# Raw data lives in Excel; a cleaned Parquet copy is cached next to it
 excel_path = r"Data/Review_Category_Report.xlsx"
-raw_df = pd.read_excel(excel_path, sheet_name='Sheet1')
-
-# Clean data
-raw_df = raw_df.dropna(subset=['Company Name', 'Standardized Category'])
-raw_df['Review Count'] = pd.to_numeric(raw_df['Review Count'], errors='coerce').fillna(0).astype(int)
 
 # Standardize company types
 company_type_mapping = {
     'Modern/High-Class Private Hospital': 'High-Class Private Hospital'
 }
-raw_df['Company Type'] = raw_df['Company Type'].replace(company_type_mapping)
 
 # Standardize categories to exact specified names
 category_mapping = {
@@ -34,20 +34,108 @@ category_mapping = {
     'Expensive Costs': 'Expensive Costs',
     'Others': 'Others'
 }
-raw_df['Standardized Category'] = raw_df['Standardized Category'].replace(category_mapping)
 
-# ===== 3. PREPARE VISUALIZATION DATA =====
-# Create visualization dataframe
-viz_df = raw_df.copy()
+# Service categories in exact specified order (dropdowns, charts and tables)
+available_categories = [
+    'Slow Services or Lengthy Waiting Times',
+    'Unavailability of Medication/Equipment',
+    'Unprofessional Staff',
+    'Unavailability of Specialists',
+    'Poor Compensation',
+    'Hostility',
+    'Expensive Costs',
+    'Others'
+]
 
-# === 3.1 Count of Companies per Category ===
-company_counts = (
-    raw_df.groupby(['Standardized Category', 'Company Type'])
-    .size()
-    .unstack(fill_value=0)
-    .reset_index()
-)
+# Bump when the cleaning steps below change, so existing caches are rebuilt
+cache_version = 1
+
+# Identifies the cleaning that produced a cached file; editing the version
+# or any of the mappings/categories above invalidates the cache
+cache_key = hashlib.sha256(json.dumps(
+    [cache_version, company_type_mapping, category_mapping, available_categories]
+).encode()).hexdigest()
+
+def use_arrow_categories(df):
+    # Parquet and Series.map both leave category labels as Python objects;
+    # store them as Arrow strings so fresh and cached loads match
+    for col in ['Company Type', 'Company Name', 'Company Location', 'Standardized Category']:
+        df[col] = df[col].cat.rename_categories(
+            df[col].cat.categories.astype('string[pyarrow]')
+        )
+    return df
+
+def load_reviews():
+    xlsx = Path(excel_path)
+    pq = xlsx.with_suffix('.parquet')
+
+    # Reuse the cleaned cache unless the Excel file or the cleaning has changed since
+    if pq.exists() and pq.stat().st_mtime >= xlsx.stat().st_mtime:
+        cached = pd.read_parquet(pq)
+        if cached.attrs.get('cache_key') == cache_key:
+            return use_arrow_categories(cached)
 
+    # Load only the columns the dashboard uses, with the Rust-based calamine reader
+    df = pd.read_excel(
+        xlsx,
+        sheet_name='Sheet1',
+        engine='calamine',
+        usecols=[
+            'Company Name',
+            'Standardized Category',
+            'Company Type',
+            'Review Count',
+            'Company Location'
+        ],
+        dtype={
+            'Company Name': 'string[pyarrow]',
+            'Standardized Category': 'string[pyarrow]',
+            'Company Type': 'string[pyarrow]',
+            'Company Location': 'string[pyarrow]'
+        }
+    )
+
+    # Clean data
+    df = df.dropna(subset=['Company Name', 'Standardized Category'])
+    df['Review Count'] = pd.to_numeric(df['Review Count'], errors='coerce').fillna(0).astype('int32')
+
+    # Store the low-cardinality text columns as categoricals, so the
+    # standardization below maps each distinct value once instead of every row
+    for col in ['Company Type', 'Company Name', 'Company Location', 'Standardized Category']:
+        df[col] = df[col].astype('category')
+    df['Company Type'] = (
+        df['Company Type']
+        .map(lambda value: company_type_mapping.get(value, value))
+        .astype('category')
+    )
+    standardized = df['Standardized Category'].map(lambda value: category_mapping.get(value, value))
+
+    # Order service categories as specified (any unexpected ones go last)
+    extra_categories = sorted(set(standardized) - set(available_categories))
+    df['Standardized Category'] = pd.Categorical(
+        standardized,
+        categories=available_categories + extra_categories,
+        ordered=True
+    )
+    df = use_arrow_categories(df)
+
+    # Cache the cleaned data; a read-only data folder just means no cache.
+    # The key is stored in the Parquet metadata via DataFrame.attrs.
+    # Write to a per-process temp file first so concurrent workers never
+    # see a partially written cache.
+    tmp = pq.with_name(f"{pq.name}.{os.getpid()}.tmp")
+    df.attrs['cache_key'] = cache_key
+    try:
+        df.to_parquet(tmp, compression='zstd')
+        os.replace(tmp, pq)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+    return df
+
+raw_df = load_reviews()
+
+# ===== 3. PREPARE VISUALIZATION DATA =====
 # Define our company types of interest
 company_types = [
     'Government Hospital',
@@ -55,58 +143,63 @@ company_types = [
     'High-Class Private Hospital'
 ]
 
-# Ensure all required columns exist
-for ct in company_types:
-    if ct not in company_counts.columns:
-        company_counts[ct] = 0
+# Row count and review total per category and company type, in a single pass
+category_type_stats = (
+    raw_df.groupby(['Standardized Category', 'Company Type'], observed=True)
+    .agg(n=('Review Count', 'size'), reviews=('Review Count', 'sum'))
+)
+
+# Both statistics pivoted to one column per company type, in a single unstack
+category_type_wide = category_type_stats.unstack(fill_value=0)
+
+# === 3.1 Count of Companies per Category ===
+# One column per company type of interest, filling in any that are missing
+company_counts = category_type_wide['n'].reindex(columns=company_types, fill_value=0)
 
 # Add Total column
-company_counts['Total'] = company_counts[company_types].sum(axis=1).astype(int)
-company_counts = company_counts.rename(columns={'Standardized Category': 'Category'})
+company_counts['Total'] = company_counts.sum(axis=1).astype('int32')
+company_counts = company_counts.reset_index().rename(columns={'Standardized Category': 'Category'})
 
 # === 3.2 Number of Reviews per Company Type ===
-reviews_per_type = (
-    raw_df.groupby(['Standardized Category', 'Company Type'])
-    ['Review Count'].sum()
-    .unstack(fill_value=0)
-    .reset_index()
-)
-
 # Include only the three company types
-for ct in company_types:
-    if ct not in reviews_per_type.columns:
-        reviews_per_type[ct] = 0
+reviews_per_type = category_type_wide['reviews'].reindex(columns=company_types, fill_value=0)
 
 # Add Total and format as integers
-reviews_per_type['Total'] = reviews_per_type[company_types].sum(axis=1).astype(int)
-reviews_per_type = reviews_per_type.rename(columns={'Standardized Category': 'Category'})
+reviews_per_type['Total'] = reviews_per_type.sum(axis=1).astype('int32')
+reviews_per_type = reviews_per_type.reset_index().rename(columns={'Standardized Category': 'Category'})
+
+# Display copy with counts formatted as e.g. "1,234 reviews"
+reviews_table_data = reviews_per_type.copy()
+for col in company_types + ['Total']:
+    reviews_table_data[col] = reviews_table_data[col].map('{:,} reviews'.format)
 
 # === 3.3 Prepare data for visualizations ===
-category_reviews = viz_df.groupby('Standardized Category')['Review Count'].sum().reset_index()
-reviews_by_type = viz_df.groupby(['Standardized Category', 'Company Type'])['Review Count'].sum().reset_index()
+reviews_by_type = category_type_stats['reviews'].rename('Review Count').reset_index()
+
+# Category totals come from raw_df, not the two-key stats above: that groupby
+# drops rows with a blank Company Type, whose reviews still count here
+category_reviews = raw_df.groupby('Standardized Category', observed=True)['Review Count'].sum()
 
-# Prepare company breakdown data
-company_breakdown = viz_df[['Standardized Category', 'Company Name', 'Company Location']].drop_duplicates()
-company_breakdown = company_breakdown.groupby('Standardized Category').apply(
-    lambda x: x[['Company Name', 'Company Location']].to_dict('records')
+# The charts no longer pass category_orders, so fix the specified order here
+# rather than relying on the column's categorical ordering
+category_reviews = category_reviews.reindex(
+    [c for c in available_categories if c in category_reviews.index]
+    + [c for c in category_reviews.index if c not in available_categories]
 ).reset_index()
-company_breakdown.columns = ['Category', 'Companies']
 
-# Get unique categories for dropdown in exact specified order
-available_categories = [
-    'Slow Services or Lengthy Waiting Times',
-    'Unavailability of Medication/Equipment',
-    'Unprofessional Staff',
-    'Unavailability of Specialists',
-    'Poor Compensation',
-    'Hostility',
-    'Expensive Costs',
-    'Others'
-]
+# Per-category review sums by company type, looked up by the category pie
+category_type_reviews = {
+    category: group[['Company Type', 'Review Count']].reset_index(drop=True)
+    for category, group in reviews_by_type.groupby('Standardized Category', observed=True)
+}
 
 # ===== 4. INITIALIZE DASH APP =====
-# Initialize Dash app with a professional theme
-app = Dash(__name__, external_stylesheets=[dbc.themes.LUX])
+# Initialize Dash app with a professional theme, gzip-compressing responses
+app = Dash(__name__, external_stylesheets=[dbc.themes.LUX], compress=True)
+
+# Flask server for production WSGI servers, e.g. `gunicorn app:server`
+# (see gunicorn.conf.py)
+server = app.server
 
 # Professional color scheme
 colors = {
@@ -175,11 +268,148 @@ custom_css = {
         'letterSpacing': '0.05em'
     }
 }
+custom_css['metric_card'] = {**custom_css['card'], 'padding': '20px'}
+
+# Styles shared by the data tables
+striped_rows = [
+    {
+        'if': {'row_index': 'odd'},
+        'backgroundColor': colors['table_row_odd']
+    },
+    {
+        'if': {'row_index': 'even'},
+        'backgroundColor': colors['table_row_even']
+    }
+]
+table_css = {
+    'header': {
+        'backgroundColor': colors['table_header'],
+        'color': 'white',
+        'fontWeight': '600',
+        'textAlign': 'center',
+        'border': 'none',
+        'fontSize': '0.85rem',
+        'textTransform': 'uppercase',
+        'letterSpacing': '0.05em'
+    },
+    'cell': {
+        'textAlign': 'center',
+        'padding': '12px',
+        'border': 'none',
+        'fontFamily': '"Inter", sans-serif',
+        'borderBottom': f'1px solid {colors["table_border"]}'
+    },
+    'table': {
+        'overflowX': 'auto',
+        'borderRadius': '12px',
+        'border': f'1px solid {colors["table_border"]}'
+    },
+    'striped_rows': striped_rows,
+    # Striped rows plus a highlighted Total column, for the summary tables
+    'summary_rows': striped_rows + [
+        {
+            'if': {'column_id': 'Total'},
+            'backgroundColor': '#f1f5f9',
+            'fontWeight': '600'
+        }
+    ]
+}
+
+# ===== 6. BUILD STATIC FIGURES =====
+# These charts do not depend on any input, so build them once at startup.
+# Their data is already sorted by the ordered 'Standardized Category'.
+# === 6.1 Enhanced Pie Chart ===
+pie_fig = px.pie(
+    category_reviews,
+    values='Review Count',
+    names='Standardized Category',
+    title='',
+    hole=0.6,
+    color_discrete_sequence=px.colors.qualitative.Pastel
+)
+pie_fig.update_traces(
+    sort=False,
+    direction='clockwise',
+    textposition='inside',
+    textinfo='percent+label',
+    marker=dict(line=dict(color='#ffffff', width=1)),
+    pull=[0.05 if i == 0 else 0 for i in range(len(category_reviews))]
+)
+pie_fig.update_layout(
+    plot_bgcolor=colors['card_bg'],
+    paper_bgcolor=colors['card_bg'],
+    font=dict(color=colors['text'], family='"Inter", sans-serif'),
+    margin=dict(t=0, b=0, l=0, r=0),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=-0.1,
+        xanchor="center",
+        x=0.5,
+        font=dict(size=12)
+    ),
+    hoverlabel=dict(
+        bgcolor='white',
+        font_size=12,
+        font_family='"Inter", sans-serif'
+    )
+)
+
+# === 6.2 Enhanced Stacked Bar Chart ===
+stacked_fig = px.bar(
+    reviews_by_type,
+    x='Standardized Category',
+    y='Review Count',
+    color='Company Type',
+    title='',
+    color_discrete_map={
+        'Government Hospital': colors['government'],
+        'Small Private Hospital': colors['small_private'],
+        'High-Class Private Hospital': colors['high_class']
+    }
+)
+stacked_fig.update_layout(
+    plot_bgcolor=colors['card_bg'],
+    paper_bgcolor=colors['card_bg'],
+    font=dict(color=colors['text'], family='"Inter", sans-serif', size=12),
+    barmode='stack',
+    xaxis={
+        'categoryorder':'array',
+        'categoryarray': available_categories,
+        'title': None,
+        'tickfont': dict(size=12),
+        'gridcolor': colors['table_border']
+    },
+    yaxis={
+        'title': None,
+        'gridcolor': colors['table_border'],
+        'tickformat': ','
+    },
+    legend=dict(
+        title=None,
+        orientation="h",
+        yanchor="bottom",
+        y=-0.3,
+        xanchor="center",
+        x=0.5,
+        font=dict(size=12)
+    ),
+    margin=dict(b=100, t=20),
+    hovermode='x unified',
+    hoverlabel=dict(
+        bgcolor='white',
+        font_size=12,
+        font_family='"Inter", sans-serif'
+    )
+)
+stacked_fig.update_traces(
+    hovertemplate='%{y:,} reviews<extra></extra>'
+)
 
-# ===== 6. APP LAYOUT =====
+# ===== 7. APP LAYOUT =====
 # Font import and global styles
 app.layout = dbc.Container([
-    # === 6.1 Header Section ===
+    # === 7.1 Header Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
@@ -208,7 +438,7 @@ app.layout = dbc.Container([
         ], width=12)
     ]),
     
-    # === 6.2 Key Metrics Section ===
+    # === 7.2 Key Metrics Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
@@ -220,12 +450,12 @@ app.layout = dbc.Container([
                         'marginBottom': '16px',
                         'borderRadius': '2px'
                     }),
-                    html.H3(f"{viz_df['Review Count'].sum():,}", 
+                    html.H3(f"{raw_df['Review Count'].sum():,}", 
                            style=custom_css['metric']),
                     html.P("TOTAL REVIEWS ANALYZED", 
                           style=custom_css['metric_label'])
                 ], style={'textAlign': 'center'})
-            ], style={**custom_css['card'], 'padding': '20px'})
+            ], style=custom_css['metric_card'])
         ], md=4),
         
         dbc.Col([
@@ -238,12 +468,12 @@ app.layout = dbc.Container([
                         'marginBottom': '16px',
                         'borderRadius': '2px'
                     }),
-                    html.H3(f"{viz_df['Company Name'].nunique():,}", 
+                    html.H3(f"{raw_df['Company Name'].nunique():,}", 
                            style=custom_css['metric']),
                     html.P("HEALTHCARE COMPANIES", 
                           style=custom_css['metric_label'])
                 ], style={'textAlign': 'center'})
-            ], style={**custom_css['card'], 'padding': '20px'})
+            ], style=custom_css['metric_card'])
         ], md=4),
         
         dbc.Col([
@@ -261,17 +491,18 @@ app.layout = dbc.Container([
                     html.P("SERVICE CATEGORIES", 
                           style=custom_css['metric_label'])
                 ], style={'textAlign': 'center'})
-            ], style={**custom_css['card'], 'padding': '20px'})
+            ], style=custom_css['metric_card'])
         ], md=4)
     ], className="mb-4"),
     
-    # === 6.3 Visualization Section ===
+    # === 7.3 Visualization Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
                 html.H3("Review Distribution by Service Category", 
                        style=custom_css['section_header']),
                 dcc.Graph(id='pie-chart',
+                          figure=pie_fig,
                           config={'displayModeBar': False},
                           style={'height': '750px'})
             ], style=custom_css['card'])
@@ -282,13 +513,14 @@ app.layout = dbc.Container([
                 html.H3("Review Volume by Company Type", 
                        style=custom_css['section_header']),
                 dcc.Graph(id='stacked-bar',
+                          figure=stacked_fig,
                           config={'displayModeBar': False},
                           style={'height': '900px'})
             ], style=custom_css['card'])
         ], lg=6)
     ], className="mb-4"),
     
-    # === 6.4 Detailed Analysis Section ===
+    # === 7.4 Detailed Analysis Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
@@ -310,7 +542,7 @@ app.layout = dbc.Container([
         ], width=12)
     ], className="mb-4"),
     
-    # === 6.5 Data Tables Section ===
+    # === 7.5 Data Tables Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
@@ -326,37 +558,9 @@ app.layout = dbc.Container([
                         {"name": "Total", "id": "Total"}
                     ],
                     data=company_counts.to_dict('records'),
-                    style_header={
-                        'backgroundColor': colors['table_header'],
-                        'color': 'white',
-                        'fontWeight': '600',
-                        'textAlign': 'center',
-                        'border': 'none',
-                        'fontSize': '0.85rem',
-                        'textTransform': 'uppercase',
-                        'letterSpacing': '0.05em'
-                    },
-                    style_cell={
-                        'textAlign': 'center',
-                        'padding': '12px',
-                        'border': 'none',
-                        'fontFamily': '"Inter", sans-serif',
-                        'borderBottom': f'1px solid {colors["table_border"]}'
-                    },
-                    style_data_conditional=[
-                        {
-                            'if': {'row_index': 'odd'},
-                            'backgroundColor': colors['table_row_odd']
-                        },
-                        {
-                            'if': {'row_index': 'even'},
-                            'backgroundColor': colors['table_row_even']
-                        },
-                        {
-                            'if': {'column_id': 'Total'},
-                            'backgroundColor': '#f1f5f9',
-                            'fontWeight': '600'
-                        },
+                    style_header=table_css['header'],
+                    style_cell=table_css['cell'],
+                    style_data_conditional=table_css['summary_rows'] + [
                         {
                             'if': {
                                 'filter_query': '{Government Hospital} > 0',
@@ -382,11 +586,7 @@ app.layout = dbc.Container([
                             'fontWeight': '500'
                         }
                     ],
-                    style_table={
-                        'overflowX': 'auto',
-                        'borderRadius': '12px',
-                        'border': f'1px solid {colors["table_border"]}'
-                    }
+                    style_table=table_css['table']
                 )
             ], style=custom_css['card'])
         ], lg=6),
@@ -408,44 +608,10 @@ app.layout = dbc.Container([
                         {"name": "Total", "id": "Total", 
                          "type": "text"}
                     ],
-                    data=[{
-                        'Category': row['Category'],
-                        'Government Hospital': f"{row['Government Hospital']:,} reviews" if row['Government Hospital'] > 0 else "0 reviews",
-                        'Small Private Hospital': f"{row['Small Private Hospital']:,} reviews" if row['Small Private Hospital'] > 0 else "0 reviews",
-                        'High-Class Private Hospital': f"{row['High-Class Private Hospital']:,} reviews" if row['High-Class Private Hospital'] > 0 else "0 reviews",
-                        'Total': f"{row['Total']:,} reviews" if row['Total'] > 0 else "0 reviews"
-                    } for row in reviews_per_type.to_dict('records')],
-                    style_header={
-                        'backgroundColor': colors['table_header'],
-                        'color': 'white',
-                        'fontWeight': '600',
-                        'textAlign': 'center',
-                        'border': 'none',
-                        'fontSize': '0.85rem',
-                        'textTransform': 'uppercase',
-                        'letterSpacing': '0.05em'
-                    },
-                    style_cell={
-                        'textAlign': 'center',
-                        'padding': '12px',
-                        'border': 'none',
-                        'fontFamily': '"Inter", sans-serif',
-                        'borderBottom': f'1px solid {colors["table_border"]}'
-                    },
-                    style_data_conditional=[
-                        {
-                            'if': {'row_index': 'odd'},
-                            'backgroundColor': colors['table_row_odd']
-                        },
-                        {
-                            'if': {'row_index': 'even'},
-                            'backgroundColor': colors['table_row_even']
-                        },
-                        {
-                            'if': {'column_id': 'Total'},
-                            'backgroundColor': '#f1f5f9',
-                            'fontWeight': '600'
-                        },
+                    data=reviews_table_data.to_dict('records'),
+                    style_header=table_css['header'],
+                    style_cell=table_css['cell'],
+                    style_data_conditional=table_css['summary_rows'] + [
                         {
                             'if': {'column_id': 'Government Hospital'},
                             'color': colors['government'],
@@ -462,17 +628,13 @@ app.layout = dbc.Container([
                             'fontWeight': '500'
                         }
                     ],
-                    style_table={
-                        'overflowX': 'auto',
-                        'borderRadius': '12px',
-                        'border': f'1px solid {colors["table_border"]}'
-                    }
+                    style_table=table_css['table']
                 )
             ], style=custom_css['card'])
         ], lg=6)
     ], className="mb-4"),
     
-    # === 6.6 Company Breakdown Section ===
+    # === 7.6 Company Breakdown Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
@@ -497,7 +659,7 @@ app.layout = dbc.Container([
         ], width=12)
     ], className="mb-4"),
     
-    # === 6.7 Footer Section ===
+    # === 7.7 Footer Section ===
     dbc.Row([
         dbc.Col([
             html.Div([
@@ -520,112 +682,17 @@ app.layout = dbc.Container([
     'maxWidth': '1400px'
 })
 
-# ===== 7. CALLBACK FUNCTIONS =====
-@app.callback(
-    Output('pie-chart', 'figure'),
-    Output('stacked-bar', 'figure'),
-    Input('pie-chart', 'hoverData')
-)
-def update_figures(hover_data):
-    # === 7.1 Enhanced Pie Chart ===
-    pie_fig = px.pie(
-        category_reviews,
-        values='Review Count',
-        names='Standardized Category',
-        title='',
-        hole=0.6,
-        color_discrete_sequence=px.colors.qualitative.Pastel,
-        category_orders={'Standardized Category': available_categories}
-    )
-    pie_fig.update_traces(
-        textposition='inside',
-        textinfo='percent+label',
-        marker=dict(line=dict(color='#ffffff', width=1)),
-        pull=[0.05 if i == 0 else 0 for i in range(len(category_reviews))]
-    )
-    pie_fig.update_layout(
-        plot_bgcolor=colors['card_bg'],
-        paper_bgcolor=colors['card_bg'],
-        font=dict(color=colors['text'], family='"Inter", sans-serif'),
-        margin=dict(t=0, b=0, l=0, r=0),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.1,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=12)
-        ),
-        hoverlabel=dict(
-            bgcolor='white',
-            font_size=12,
-            font_family='"Inter", sans-serif'
-        )
-    )
-    
-    # === 7.2 Enhanced Stacked Bar Chart ===
-    stacked_fig = px.bar(
-        reviews_by_type,
-        x='Standardized Category',
-        y='Review Count',
-        color='Company Type',
-        title='',
-        color_discrete_map={
-            'Government Hospital': colors['government'],
-            'Small Private Hospital': colors['small_private'],
-            'High-Class Private Hospital': colors['high_class']
-        },
-        category_orders={'Standardized Category': available_categories}
-    )
-    stacked_fig.update_layout(
-        plot_bgcolor=colors['card_bg'],
-        paper_bgcolor=colors['card_bg'],
-        font=dict(color=colors['text'], family='"Inter", sans-serif', size=12),
-        barmode='stack',
-        xaxis={
-            'categoryorder':'array',
-            'categoryarray': available_categories,
-            'title': None,
-            'tickfont': dict(size=12),
-            'gridcolor': colors['table_border']
-        },
-        yaxis={
-            'title': None,
-            'gridcolor': colors['table_border'],
-            'tickformat': ','
-        },
-        legend=dict(
-            title=None,
-            orientation="h",
-            yanchor="bottom",
-            y=-0.3,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=12)
-        ),
-        margin=dict(b=100, t=20),
-        hovermode='x unified',
-        hoverlabel=dict(
-            bgcolor='white',
-            font_size=12,
-            font_family='"Inter", sans-serif'
-        )
+# ===== 8. CALLBACK FUNCTIONS =====
+# Callback output depends only on the selected category, so it is memoized;
+# figures are cached as plain dicts so Dash can skip the Figure conversion
+@lru_cache(maxsize=16)
+def _build_category_pie(selected_category):
+    # === 8.1 Category Pie Chart ===
+    # Look up review sums by company type for the selected category
+    category_by_type = category_type_reviews.get(
+        selected_category,
+        pd.DataFrame(columns=['Company Type', 'Review Count'])
     )
-    stacked_fig.update_traces(
-        hovertemplate='%{y:,} reviews<extra></extra>'
-    )
-    
-    return pie_fig, stacked_fig
-
-@app.callback(
-    Output('category-pie-chart', 'figure'),
-    Input('category-dropdown', 'value')
-)
-def update_category_pie(selected_category):
-    # === 7.3 Category Pie Chart ===
-    # Filter data for selected category
-    category_data = viz_df[viz_df['Standardized Category'] == selected_category]
-    category_by_type = category_data.groupby('Company Type')['Review Count'].sum().reset_index()
     
     # Create enhanced donut chart
     fig = px.pie(
@@ -670,18 +737,30 @@ def update_category_pie(selected_category):
         showarrow=False
     )
     
-    return fig
+    return fig.to_plotly_json()
 
 @app.callback(
-    Output('company-breakdown-table', 'children'),
-    Input('breakdown-category-dropdown', 'value')
+    Output('category-pie-chart', 'figure'),
+    Input('category-dropdown', 'value')
 )
-def update_company_breakdown(selected_category):
-    # === 7.4 Company Breakdown Table ===
-    # Find the selected category in our breakdown data
-    breakdown = company_breakdown[company_breakdown['Category'] == selected_category]
+def update_category_pie(selected_category):
+    return _build_category_pie(selected_category)
+
+@lru_cache(maxsize=16)
+def _build_breakdown(selected_category):
+    # === 8.2 Company Breakdown Table ===
+    # Get the list of companies for the selected category; built on first
+    # request only, since this section sits at the bottom of the page
+    companies = (
+        raw_df.loc[
+            raw_df['Standardized Category'] == selected_category,
+            ['Company Name', 'Company Location']
+        ]
+        .drop_duplicates()
+        .to_dict('records')
+    )
     
-    if breakdown.empty:
+    if not companies:
         return html.Div(
             "No companies found for this service category",
             style={
@@ -694,9 +773,6 @@ def update_company_breakdown(selected_category):
             }
         )
     
-    # Get the list of companies for this category
-    companies = breakdown.iloc[0]['Companies']
-    
     # Create a clean table of company names and locations
     return dash_table.DataTable(
         columns=[
@@ -704,35 +780,12 @@ def update_company_breakdown(selected_category):
             {"name": "Location", "id": "Company Location", "type": "text"}
         ],
         data=companies,
-        style_header={
-            'backgroundColor': colors['table_header'],
-            'color': 'white',
-            'fontWeight': '600',
-            'textAlign': 'left',
-            'border': 'none',
-            'fontSize': '0.85rem',
-            'textTransform': 'uppercase',
-            'letterSpacing': '0.05em'
-        },
-        style_cell={
-            'textAlign': 'left',
-            'padding': '12px',
-            'border': 'none',
-            'fontFamily': '"Inter", sans-serif',
-            'borderBottom': f'1px solid {colors["table_border"]}'
-        },
+        style_header={**table_css['header'], 'textAlign': 'left'},
+        style_cell={**table_css['cell'], 'textAlign': 'left'},
         style_data={
             'border': 'none'
         },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': colors['table_row_odd']
-            },
-            {
-                'if': {'row_index': 'even'},
-                'backgroundColor': colors['table_row_even']
-            },
+        style_data_conditional=table_css['striped_rows'] + [
             {
                 'if': {'column_id': 'Company Name'},
                 'fontWeight': '600',
@@ -749,6 +802,17 @@ def update_company_breakdown(selected_category):
         }
     )
 
-# ===== 8. RUN APPLICATION =====
+@app.callback(
+    Output('company-breakdown-table', 'children'),
+    Input('breakdown-category-dropdown', 'value')
+)
+def update_company_breakdown(selected_category):
+    return _build_breakdown(selected_category)
+
+# Build every category's pie up front so no user request pays for it
+for category in available_categories:
+    _build_category_pie(category)
+
+# ===== 9. RUN APPLICATION =====
 if __name__ == '__main__':
     app.run(debug=True, dev_tools_hot_reload=False)
\ No newline at end of file
@@ -0,0 +1,10 @@
+# Gunicorn settings, picked up automatically by `gunicorn app:server`
+
+bind = "0.0.0.0:8050"
+workers = 4
+worker_class = "gthread"
+threads = 4
+
+# Load the data and build the figures once in the master process; workers
+# are forked afterwards and share those caches instead of rebuilding them
+preload_app = True